@@ -0,0 +1,159 @@
+"""
+Pool of launched browsers shared between automation agents
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PooledBrowser:
+    """A pool slot: its browser once launched, plus how many agents are using it"""
+    
+    def __init__(self):
+        self.browser = None
+        # Resolves to the browser, or to None if its launch failed
+        self.ready = asyncio.get_event_loop().create_future()
+        self.users = 0
+        self.idle_since = time.monotonic()
+
+
+class BrowserPool:
+    """Launched browsers kept warm between agents, grouped by launch profile name
+    
+    Agents share browsers (each opens its own contexts): acquire() hands out the
+    least busy browser for a profile and only launches another while every one is
+    in use and fewer than size are running. Launches happen outside the pool lock
+    in a reserved slot, so agents are never held up by another agent's launch
+    unless they are sharing that browser. Browsers that nobody has used for
+    max_idle seconds are closed by a background reaper.
+    """
+    
+    def __init__(self, size: int = 1, max_idle: float = 300.0):
+        self.size = size
+        self.max_idle = max_idle
+        self._browsers: Dict[str, List[PooledBrowser]] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._reaper: Optional[asyncio.Task] = None
+        self._warmer: Optional[asyncio.Task] = None
+        
+    def _get_lock(self) -> asyncio.Lock:
+        """Lock guarding the pool, created inside the running event loop"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+        
+    def _live(self, name: str) -> List[PooledBrowser]:
+        """Browsers for name that are still connected or still launching"""
+        entries = [entry for entry in self._browsers.get(name, [])
+                   if entry.browser is None or entry.browser.is_connected()]
+        self._browsers[name] = entries
+        return entries
+        
+    async def acquire(self, name: str, launch, **launch_options):
+        """Return a browser for name, launching one with launch(**launch_options) if needed"""
+        async with self._get_lock():
+            entries = self._live(name)
+            entry = min(entries, key=lambda candidate: candidate.users, default=None)
+            launching = entry is None or (entry.users > 0 and len(entries) < self.size)
+            if launching:
+                entry = PooledBrowser()
+                entries.append(entry)
+            entry.users += 1
+        self._start_reaper()
+        if launching:
+            await self._launch(name, entry, launch, **launch_options)
+        try:
+            browser = await asyncio.shield(entry.ready)
+        except asyncio.CancelledError:
+            entry.users -= 1
+            raise
+        if browser is None:
+            # Someone else's launch of this slot failed; try again with a slot of our own
+            return await self.acquire(name, launch, **launch_options)
+        return browser
+        
+    async def _launch(self, name: str, entry: PooledBrowser, launch, **launch_options):
+        """Launch the browser for a reserved slot, dropping the slot if the launch fails"""
+        try:
+            entry.browser = await launch(**launch_options)
+        except BaseException:
+            if entry in self._browsers.get(name, []):
+                self._browsers[name].remove(entry)
+            entry.ready.set_result(None)
+            raise
+        entry.idle_since = time.monotonic()
+        entry.ready.set_result(entry.browser)
+        
+    def release(self, browser):
+        """Hand a browser back to the pool; it stays open for the next agent"""
+        for entries in self._browsers.values():
+            for entry in entries:
+                if entry.browser is browser:
+                    entry.users = max(entry.users - 1, 0)
+                    if entry.users == 0:
+                        entry.idle_since = time.monotonic()
+                    return
+        
+    async def warm(self, name: str, launch, count: int = None, **launch_options):
+        """Launch idle browsers for name until count (default: size) are running"""
+        count = self.size if count is None else count
+        async with self._get_lock():
+            entries = self._live(name)
+            reserved = [PooledBrowser() for _ in range(count - len(entries))]
+            entries.extend(reserved)
+        self._start_reaper()
+        await asyncio.gather(*(self._launch(name, entry, launch, **launch_options) for entry in reserved))
+        
+    def warm_in_background(self, name: str, launch, **launch_options):
+        """Start filling the pool for name in a background task, unless one is already running"""
+        if self.size > 1 and (self._warmer is None or self._warmer.done()):
+            self._warmer = asyncio.ensure_future(self._warm_quietly(name, launch, **launch_options))
+            
+    async def _warm_quietly(self, name: str, launch, **launch_options):
+        """warm(), logging rather than raising on launch failures"""
+        try:
+            await self.warm(name, launch, **launch_options)
+        except Exception as e:
+            logger.warning("Could not pre-launch pooled browsers: %s", e)
+            
+    def _start_reaper(self):
+        """Start the idle reaper once per event loop"""
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.ensure_future(self._reap_idle())
+        
+    async def _reap_idle(self):
+        """Close browsers that have been idle for longer than max_idle"""
+        while True:
+            await asyncio.sleep(max(self.max_idle / 2, 1))
+            now = time.monotonic()
+            stale = []
+            async with self._get_lock():
+                for name, entries in self._browsers.items():
+                    for entry in [entry for entry in entries if entry.users == 0 and entry.browser is not None
+                                  and now - entry.idle_since >= self.max_idle]:
+                        entries.remove(entry)
+                        stale.append(entry)
+                        logger.info("Closing %s browser idle for %ds", name, now - entry.idle_since)
+            # Removed from the pool above, so they can be closed without holding the lock
+            await asyncio.gather(*(entry.browser.close() for entry in stale), return_exceptions=True)
+        
+    async def close(self):
+        """Stop the background tasks and close every pooled browser"""
+        # Wait for the warm-up and reaper to finish cancelling so neither touches the pool afterwards
+        tasks = [task for task in (self._warmer, self._reaper) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._warmer = self._reaper = None
+        async with self._get_lock():
+            # Close every browser at once; one failing does not stop the others
+            await asyncio.gather(
+                *(entry.browser.close() for entries in self._browsers.values() for entry in entries
+                  if entry.browser is not None),
+                return_exceptions=True
+            )
+            self._browsers.clear()
+        self._lock = None
@@ -1,11 +1,15 @@
 """
 Configuration settings for Roku Movie Automation
 """
+from __future__ import annotations
+
+import logging
+import math
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
 
-@dataclass
+@dataclass(frozen=True)
 class AutomationConfig:
     """Configuration class for automation settings"""
     
@@ -17,12 +21,20 @@ class AutomationConfig:
     headless: bool = False
     window_size: tuple = (1920, 1080)
     slow_mo: int = 0  # Slow down operations by specified ms
+    user_data_dir: str | None = None  # Persistent Chrome profile; keeps cache/cookies between runs
+    remote_debugging_port: int | None = None  # Expose launched Chromium over CDP for --cdp-endpoint runs
+    browser_pool_size: int = 1  # Browsers to launch and spread agents across (see --workers)
+    cdp_endpoint: str | None = None  # Connect to a running Chromium (e.g. http://localhost:9222) instead of launching one
+    use_tmpfs: bool = False  # Keep a throwaway Chrome profile in RAM (/dev/shm) instead of on disk
     
     # Automation settings
-    max_loops: int = 5  # Set to -1 for infinite loops
+    max_loops: int = 5  # Set to -1 for infinite loops; 0 runs no loops
     loop_delay: int = 5  # Seconds to wait between loops
+    workers: int = 1  # Parallel playback loops sharing one browser
     page_load_timeout: int = 30
     element_wait_timeout: int = 10
+    reuse_page: bool = True  # Keep the same page between loops; False opens a fresh context each loop
+    block_resources: bool = True  # Skip images/fonts/media on the details page
     
     # Playback settings
     play_button_selector: str = "button[data-testid='play-button'], .play-button, [aria-label*='play'], [aria-label*='Play']"
@@ -31,17 +43,92 @@ class AutomationConfig:
     # Logging
     log_level: str = "INFO"
     save_screenshots: bool = True
+    debug_analyze: bool = False  # Log a page structure analysis after clicking play
     screenshot_dir: str = "screenshots"
+    log_level_int: int = field(init=False, repr=False, compare=False)  # Resolved from log_level
+    loop_limit: float = field(init=False, repr=False, compare=False)  # max_loops, with math.inf for infinite
+    
+    def __post_init__(self):
+        """Check log_level up front instead of failing later inside the agent, and resolve derived settings"""
+        level = logging.getLevelName(self.log_level.upper())
+        if not isinstance(level, int):
+            raise ValueError(f"Invalid log_level {self.log_level!r}; expected DEBUG, INFO, WARNING, ERROR or CRITICAL")
+        object.__setattr__(self, 'log_level_int', level)
+        if self.max_loops < -1:
+            raise ValueError(f"Invalid max_loops {self.max_loops}; expected -1 (infinite), 0 or a positive count")
+        object.__setattr__(self, 'loop_limit', math.inf if self.max_loops < 0 else self.max_loops)
+    
+    @property
+    def play_selectors(self) -> tuple:
+        """Individual selectors from play_button_selector, split once and cached"""
+        return _split_selectors(self.play_button_selector)
+    
+    @property
+    def pause_selectors(self) -> tuple:
+        """Individual selectors from pause_button_selector, split once and cached"""
+        return _split_selectors(self.pause_button_selector)
     
     @classmethod
     def from_env(cls) -> 'AutomationConfig':
-        """Load configuration from environment variables"""
-        return cls(
-            movie_url=os.getenv('MOVIE_URL', cls.movie_url),
-            browser=os.getenv('BROWSER', cls.browser),
-            headless=os.getenv('HEADLESS', 'false').lower() == 'true',
-            slow_mo=int(os.getenv('SLOW_MO', cls.slow_mo)),
-            max_loops=int(os.getenv('MAX_LOOPS', cls.max_loops)),
-            loop_delay=int(os.getenv('LOOP_DELAY', cls.loop_delay)),
-            log_level=os.getenv('LOG_LEVEL', cls.log_level)
-        )
+        """Load configuration from environment variables (parsed once per process)"""
+        return _load_from_env()
+
+
+@lru_cache(maxsize=None)
+def _split_selectors(selector: str) -> tuple:
+    """Split a comma-joined CSS selector list into a tuple of individual selectors
+    
+    Only top-level commas separate selectors; commas inside (), [] or quotes,
+    as in :is(a, b) or [aria-label="Play, resume"], stay part of their selector.
+    """
+    parts, start, depth, quote = [], 0, 0, None
+    for index, char in enumerate(selector):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char in '([':
+            depth += 1
+        elif char in ')]':
+            depth = max(depth - 1, 0)
+        elif char == ',' and depth == 0:
+            parts.append(selector[start:index])
+            start = index + 1
+    parts.append(selector[start:])
+    return tuple(part.strip() for part in parts if part.strip())
+
+
+# (environment variable, field name, parser) for each setting from_env reads
+_ENV_SPEC = (
+    ('MOVIE_URL', 'movie_url', str),
+    ('BROWSER', 'browser', str),
+    ('HEADLESS', 'headless', lambda value: value.lower() == 'true'),
+    ('SLOW_MO', 'slow_mo', int),
+    ('USER_DATA_DIR', 'user_data_dir', str),
+    ('CDP_ENDPOINT', 'cdp_endpoint', str),
+    ('REMOTE_DEBUGGING_PORT', 'remote_debugging_port', int),
+    ('BROWSER_POOL_SIZE', 'browser_pool_size', int),
+    ('USE_TMPFS', 'use_tmpfs', lambda value: value.lower() == 'true'),
+    ('MAX_LOOPS', 'max_loops', int),
+    ('LOOP_DELAY', 'loop_delay', int),
+    ('WORKERS', 'workers', int),
+    ('REUSE_PAGE', 'reuse_page', lambda value: value.lower() == 'true'),
+    ('BLOCK_RESOURCES', 'block_resources', lambda value: value.lower() == 'true'),
+    ('LOG_LEVEL', 'log_level', str),
+    ('SAVE_SCREENSHOTS', 'save_screenshots', lambda value: value.lower() == 'true'),
+    ('DEBUG_ANALYZE', 'debug_analyze', lambda value: value.lower() == 'true'),
+)
+
+
+@lru_cache(maxsize=None)
+def _load_from_env() -> AutomationConfig:
+    """Read and parse the environment once; later calls return the cached config"""
+    env = os.environ
+    overrides = {}
+    for name, field_name, parse in _ENV_SPEC:
+        value = env.get(name)
+        # Unset variables keep the dataclass default instead of round-tripping it through str
+        if value is not None:
+            overrides[field_name] = parse(value)
+    return AutomationConfig(**overrides)
@@ -5,41 +5,42 @@ Installation script for Playwright browsers
 import subprocess
 import sys
 import os
+import platform
 
 def install_playwright_browsers():
-    """Install Playwright browsers"""
+    """Install Playwright browsers, plus system dependencies on Linux, in a single Playwright run"""
+    # install-deps only does anything on Linux; elsewhere a plain install is enough
+    with_deps = platform.system() == "Linux"
+    command = [sys.executable, "-m", "playwright", "install"]
+    if with_deps:
+        command.append("--with-deps")
+    else:
+        print("Skipping system dependencies (only needed on Linux)")
+
     try:
-        print("Installing Playwright browsers...")
-        result = subprocess.run([
-            sys.executable, "-m", "playwright", "install"
-        ], check=True, capture_output=True, text=True)
-        
+        # Progress output streams straight to the terminal; only stderr is kept for error reporting
+        print("Installing Playwright browsers...", flush=True)
+        subprocess.run(command, check=True, stderr=subprocess.PIPE, text=True)
+
         print("✅ Playwright browsers installed successfully!")
-        print(result.stdout)
-        
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error installing Playwright browsers: {e}")
-        print(f"Error output: {e.stderr}")
-        sys.exit(1)
-    except FileNotFoundError:
-        print("❌ Playwright not found. Please install it first:")
-        print("pip install playwright")
-        sys.exit(1)
 
-def install_system_dependencies():
-    """Install system dependencies for Playwright"""
-    try:
-        print("Installing system dependencies...")
-        result = subprocess.run([
-            sys.executable, "-m", "playwright", "install-deps"
-        ], check=True, capture_output=True, text=True)
-        
-        print("✅ System dependencies installed successfully!")
-        print(result.stdout)
-        
     except subprocess.CalledProcessError as e:
+        if not with_deps:
+            print(f"❌ Error installing Playwright browsers: {e}")
+            print(f"Error output: {e.stderr}")
+            sys.exit(1)
+
+        # System dependencies usually need root; retry without them rather than failing setup
         print(f"⚠️  Warning: Could not install system dependencies: {e}")
         print("You may need to install them manually for your system.")
+        command.remove("--with-deps")
+        try:
+            subprocess.run(command, check=True, stderr=subprocess.PIPE, text=True)
+            print("✅ Playwright browsers installed successfully!")
+        except subprocess.CalledProcessError as retry_error:
+            print(f"❌ Error installing Playwright browsers: {retry_error}")
+            print(f"Error output: {retry_error.stderr}")
+            sys.exit(1)
     except FileNotFoundError:
         print("❌ Playwright not found. Please install it first:")
         print("pip install playwright")
@@ -48,12 +49,9 @@ def install_system_dependencies():
 if __name__ == "__main__":
     print("🚀 Setting up Playwright for Roku Movie Automation")
     print("=" * 50)
-    
-    # Install Playwright browsers
+
+    # Install Playwright browsers (and system dependencies on Linux)
     install_playwright_browsers()
-    
-    # Install system dependencies
-    install_system_dependencies()
-    
+
     print("\n🎉 Setup complete! You can now run the automation:")
     print("python main.py")
@@ -2,46 +2,123 @@
 """
 Main entry point for Roku Movie Automation
 """
-import argparse
 import sys
-from config import AutomationConfig
-from roku_automation import RokuMovieAgent
+from types import SimpleNamespace
 
-def main():
-    """Main function to run the automation"""
+# Defaults shared by the argparse parser and the no-argument fast path
+DEFAULT_ARGS = {
+    'max_loops': 5,
+    'loop_delay': 5,
+    'workers': 1,
+    'browser': 'safari',
+    'headless': False,
+    'slow_mo': 0,
+    'user_data_dir': None,
+    'cdp_endpoint': None,
+    'remote_debugging_port': None,
+    'browser_pool_size': 1,
+    'use_tmpfs': False,
+    'fresh_context': False,
+    'load_all_resources': False,
+    'log_level': 'INFO',
+    'no_screenshots': False,
+    'debug_analyze': False,
+    'config_file': None,
+}
+
+def parse_args(argv):
+    """Parse command line arguments, skipping argparse entirely when none are given"""
+    if not argv:
+        return SimpleNamespace(**DEFAULT_ARGS)
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(description='Roku Movie Automation Agent')
-    parser.add_argument('--max-loops', type=int, default=5, 
-                       help='Maximum number of loops (-1 for infinite)')
-    parser.add_argument('--loop-delay', type=int, default=5,
+    parser.add_argument('--max-loops', type=int, 
+                       help='Maximum number of loops (-1 for infinite, 0 to run none)')
+    parser.add_argument('--loop-delay', type=int,
                        help='Delay between loops in seconds')
+    parser.add_argument('--workers', type=int,
+                       help='Number of playback loops to run in parallel in the same browser')
     parser.add_argument('--browser', choices=['safari', 'chrome', 'firefox', 'edge'], 
-                       default='safari', help='Browser to use')
+                       help='Browser to use')
     parser.add_argument('--headless', action='store_true',
                        help='Run browser in headless mode')
-    parser.add_argument('--slow-mo', type=int, default=0,
+    parser.add_argument('--slow-mo', type=int,
                        help='Slow down operations by specified milliseconds')
+    parser.add_argument('--user-data-dir', type=str,
+                       help='Chrome profile directory to reuse between runs (keeps cache and cookies)')
+    parser.add_argument('--cdp-endpoint', type=str,
+                       help='Connect to a running Chromium over CDP (e.g. http://localhost:9222) instead of launching one')
+    parser.add_argument('--remote-debugging-port', type=int,
+                       help='Let other runs connect to the launched Chromium with --cdp-endpoint http://localhost:PORT')
+    parser.add_argument('--browser-pool-size', type=int,
+                       help='Number of browsers to launch and spread parallel workers across')
+    parser.add_argument('--use-tmpfs', action='store_true',
+                       help='Keep the temporary Chrome profile in RAM (/dev/shm) instead of on disk')
+    parser.add_argument('--fresh-context', action='store_true',
+                       help='Start every loop in a new browser context instead of reusing the page')
+    parser.add_argument('--load-all-resources', action='store_true',
+                       help='Load images, fonts and media on the movie details page too')
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
-                       default='INFO', help='Logging level')
+                       help='Logging level')
+    parser.add_argument('--no-screenshots', action='store_true',
+                       help='Do not save debugging screenshots')
+    parser.add_argument('--debug-analyze', action='store_true',
+                       help='Log a page structure analysis after clicking play')
     parser.add_argument('--config-file', type=str,
                        help='Path to configuration file')
+    parser.set_defaults(**DEFAULT_ARGS)
+    
+    return parser.parse_args(argv)
+
+async def run(agent_class, config):
+    """Create the agent inside the event loop, run its automation, then close the shared browsers"""
+    agent = agent_class(config)
+    try:
+        if config.workers > 1:
+            await agent.run_many(config.workers)
+        else:
+            await agent.run_automation()
+    finally:
+        await agent.shutdown_shared()
+
+def main():
+    """Main function to run the automation"""
+    args = parse_args(sys.argv[1:])
     
-    args = parser.parse_args()
+    from config import AutomationConfig
     
     # Create configuration
     config = AutomationConfig(
         max_loops=args.max_loops,
         loop_delay=args.loop_delay,
+        workers=args.workers,
         browser=args.browser,
         headless=args.headless,
         slow_mo=args.slow_mo,
-        log_level=args.log_level
+        user_data_dir=args.user_data_dir,
+        cdp_endpoint=args.cdp_endpoint,
+        remote_debugging_port=args.remote_debugging_port,
+        browser_pool_size=args.browser_pool_size,
+        use_tmpfs=args.use_tmpfs,
+        reuse_page=not args.fresh_context,
+        block_resources=not args.load_all_resources,
+        log_level=args.log_level,
+        save_screenshots=not args.no_screenshots,
+        debug_analyze=args.debug_analyze
     )
     
-    # Create and run agent
-    agent = RokuMovieAgent(config)
+    # Import the agent lazily so --help and argument errors skip loading Playwright
+    from roku_automation import RokuMovieAgent
+    
+    import asyncio
     
+    # Create and run agent
     try:
-        agent.run_automation()
+        asyncio.run(run(RokuMovieAgent, config))
+    except KeyboardInterrupt:
+        print("Automation interrupted by user")
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -2,142 +2,668 @@
 Roku Movie Automation Agent
 Automates playing movies on Roku channel web interface using Playwright
 """
+import asyncio
+import atexit
 import time
 import logging
+import logging.handlers
 import os
 import platform
+import queue
+import re
+import shutil
+import signal
 import tempfile
 from typing import Optional
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright, Browser, BrowserContext, Locator, Page, TimeoutError as PlaywrightTimeoutError
+from browser_pool import BrowserPool
 from config import AutomationConfig
 
+# Operating system, user agents and defaults, detected once at import time
+SYSTEM = platform.system()
+IS_WINDOWS = SYSTEM == 'Windows'
+IS_MACOS = SYSTEM == 'Darwin'
+
+# Browser-specific user agents based on OS
+if IS_WINDOWS:
+    # Windows 11 user agents
+    USER_AGENTS = {
+        'chrome': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'firefox': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+        'edge': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+        'safari': None  # Safari not available on Windows
+    }
+    DEFAULT_BROWSER = 'chrome'
+elif IS_MACOS:
+    # macOS Monterey 12.7.3 user agents
+    USER_AGENTS = {
+        'safari': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12_7_3) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.6.6 Safari/605.1.15',
+        'chrome': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12_7_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'firefox': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12.7; rv:121.0) Gecko/20100101 Firefox/121.0',
+        'edge': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12_7_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0'
+    }
+    DEFAULT_BROWSER = 'safari'
+else:
+    # Linux or other OS - use generic user agents
+    USER_AGENTS = {
+        'chrome': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'firefox': 'Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0',
+        'edge': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+        'safari': None
+    }
+    DEFAULT_BROWSER = 'chrome'
+
+# Browser context timezone and display name for the current OS
+TIMEZONE = 'America/Los_Angeles' if IS_MACOS or IS_WINDOWS else 'UTC'
+OS_NAME = "Windows 11" if IS_WINDOWS else ("macOS Monterey" if IS_MACOS else SYSTEM)
+
+# Launch arguments for Chrome/Chromium
+CHROME_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--disable-site-isolation-trials',
+    # Keep timers and rendering at full speed when the window is in the background,
+    # so playback detection is not throttled
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    # Skip extensions, background services and audio output; none are needed for playback
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--mute-audio'
+]
+if not IS_WINDOWS and not IS_MACOS:
+    # /dev/shm is often tiny in containers; use /tmp for shared memory instead
+    CHROME_ARGS.append('--disable-dev-shm-usage')
+
+# Extra Chrome/Chromium arguments when running headless (no GPU compositing needed)
+CHROME_HEADLESS_ARGS = ['--disable-gpu']
+
+# RAM-backed directory for throwaway Chrome profiles (see use_tmpfs)
+TMPFS_DIR = '/dev/shm'
+
+# Play button selectors, in priority order; the configured play_button_selector
+# entries go between the Roku-specific and the generic ones
+ROKU_PLAY_SELECTORS = (
+    # Roku-specific selectors
+    "a.roku-button.icon-play",
+    "a[aria-label*='Play Ice Cross']",
+    "a[href*='/watch/']",
+    ".roku-button.padded.icon-play",
+)
+GENERIC_PLAY_SELECTORS = (
+    "button[aria-label*='play']",
+    "button[aria-label*='Play']",
+    ".play-button",
+    "[data-testid*='play']",
+    "button:has-text('Play')",
+    "button:has-text('play')",
+    "a:has-text('Play')",
+)
+
+# Pause button selectors (checked after the configured pause_button_selector entries)
+PAUSE_SELECTORS = (
+    "button[aria-label*='pause']",
+    "button[aria-label*='Pause']",
+    ".pause-button",
+    "[data-testid*='pause']",
+    # Roku-specific selectors
+    ".roku-button.icon-pause",
+    "a[aria-label*='Pause']",
+    ".roku-button[aria-label*='pause']",
+)
+
+# Video element or player selectors
+VIDEO_SELECTORS = (
+    "video",
+    ".video-player",
+    ".player",
+    "[data-testid*='video']",
+    ".roku-video-player",
+    # Additional selectors for embedded players
+    "iframe[src*='player']",
+    "iframe[src*='video']",
+    ".embed-player",
+    ".media-player",
+    "[class*='player']",
+    "[class*='video']",
+    # Roku-specific video containers
+    ".roku-player",
+    ".roku-video-container",
+    ".video-container",
+)
+
+# Video controls or progress bar selectors
+CONTROL_SELECTORS = (
+    ".progress-bar",
+    ".seek-bar",
+    ".time-display",
+    "[class*='progress']",
+    "[class*='seek']",
+    ".video-controls",
+    ".player-controls",
+    # Roku-specific controls
+    ".roku-controls",
+    ".roku-progress-bar",
+    ".roku-time-display",
+)
+
+# Modals or overlays that may contain the video
+MODAL_SELECTORS = (
+    ".modal",
+    ".overlay",
+    ".popup",
+    "[class*='modal']",
+    "[class*='overlay']",
+    ".video-modal",
+    ".player-modal",
+    ".roku-modal",
+)
+
+# Loading indicators
+LOADING_SELECTORS = (
+    ".loading",
+    ".spinner",
+    "[class*='loading']",
+    "[class*='spinner']",
+    ".roku-loading",
+)
+
+# Close buttons for the Roku modal overlay, in priority order
+MODAL_CLOSE_SELECTORS = (
+    # Specific to anonymous-nudge modal
+    ".roku-modal-overlay.anonymous-nudge .close",
+    ".roku-modal-overlay.anonymous-nudge button[aria-label*='close']",
+    ".roku-modal-overlay.anonymous-nudge button[aria-label*='Close']",
+    ".roku-modal-overlay.anonymous-nudge .close-button",
+    ".roku-modal-overlay.anonymous-nudge button[data-testid*='close']",
+    ".roku-modal-overlay.anonymous-nudge .modal-close",
+    # Look for X button or close symbol
+    ".roku-modal-overlay.anonymous-nudge [aria-label='Close']",
+    ".roku-modal-overlay.anonymous-nudge [aria-label='close']",
+    ".roku-modal-overlay.anonymous-nudge button:has-text('×')",
+    ".roku-modal-overlay.anonymous-nudge button:has-text('✕')",
+    # Generic modal close buttons
+    ".roku-modal-overlay .close",
+    ".roku-modal-overlay button[aria-label*='close']",
+    ".roku-modal-overlay button[aria-label*='Close']",
+    ".roku-modal-overlay .close-button",
+    ".roku-modal-overlay button[data-testid*='close']",
+    ".roku-modal-overlay .modal-close",
+    # Roku-specific selectors
+    ".roku-modal-overlay .roku-button[aria-label*='close']",
+    ".roku-modal-overlay .roku-button[aria-label*='Close']",
+    # Generic close buttons
+    ".roku-modal-overlay button:has-text('Close')",
+    ".roku-modal-overlay button:has-text('close')",
+    ".roku-modal-overlay [role='button']:has-text('Close')",
+    ".roku-modal-overlay [role='button']:has-text('close')",
+)
+
+# Common video player classes reported by analyze_page_structure
+PLAYER_CLASSES = (
+    "video-player", "player", "media-player", "embed-player",
+    "roku-video-player", "video-container", "player-container",
+)
+
+# Element counts and page title reported by analyze_page_structure
+PAGE_STRUCTURE_JS = """(playerClasses) => {
+    const count = (selector) => document.querySelectorAll(selector).length;
+    return {
+        video: count('video'),
+        iframe: count('iframe'),
+        playerClasses: Object.fromEntries(playerClasses.map((name) => [name, count('.' + name)])),
+        modal: count('.modal, .overlay, .popup'),
+        videoOrPlayer: count("[class*='video'], [class*='player']"),
+        playOrPause: count("[class*='play'], [class*='pause']"),
+        title: document.title,
+    };
+}"""
+
+# Returns {group: 'playing'} when the page's <video> is actually playing. Otherwise
+# returns the first [group, union, selectors, requires_media] entry with a visible match
+# of its selector union as {group, selector}, or null. Visibility mirrors Playwright's
+# is_visible (non-empty box, not visibility:hidden); requires_media only accepts
+# elements containing video/iframe.
+DETECT_PLAYBACK_JS = """(groups) => {
+    const video = document.querySelector('video');
+    if (video && !video.paused && !video.ended && video.currentTime > 0) {
+        return {group: 'playing', selector: 'video'};
+    }
+    const isVisible = (element) => {
+        const rect = element.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 &&
+            window.getComputedStyle(element).visibility !== 'hidden';
+    };
+    const safely = (query, fallback) => {
+        try {
+            return query();
+        } catch (error) {
+            return fallback;
+        }
+    };
+    for (const [group, union, selectors, requiresMedia] of groups) {
+        // One query per group; an invalid selector in the union falls back to one query each
+        const elements = safely(() => [...document.querySelectorAll(union)], null) ||
+            selectors.flatMap((selector) => safely(() => [...document.querySelectorAll(selector)], []));
+        for (const element of elements) {
+            if (!isVisible(element)) continue;
+            if (requiresMedia && !element.querySelector('video, iframe')) continue;
+            const selector = selectors.find((candidate) => safely(() => element.matches(candidate), false));
+            return {group, selector};
+        }
+    }
+    return null;
+}"""
+
+def selector_group(name: str, selectors, requires_media: bool = False) -> list:
+    """[name, CSS union, selectors, requires_media] entry for DETECT_PLAYBACK_JS"""
+    return [name, ", ".join(selectors), list(selectors), requires_media]
+
+
+# Playback evidence checked after the pause buttons, in priority order
+PLAYBACK_GROUPS = [
+    selector_group("video", VIDEO_SELECTORS),
+    selector_group("controls", CONTROL_SELECTORS),
+    selector_group("modal", MODAL_SELECTORS, requires_media=True),
+    selector_group("loading", LOADING_SELECTORS),
+]
+
+# Resource types skipped while loading the details page (see block_resources)
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+# Player page URLs, which the play button usually navigates to
+WATCH_URL_PATTERN = re.compile(r"/watch/")
+
+# Safety timeout when waiting for a movie to finish (1 hour)
+MOVIE_TIMEOUT_MS = 3600 * 1000
+
+# Resolves with 'ended' / 'already-ended' when the page's <video> finishes, 'no-video'
+# if there is none, or 'timeout' after the given number of milliseconds
+WAIT_FOR_VIDEO_END_JS = """(timeoutMs) => new Promise((resolve) => {
+    const video = document.querySelector('video');
+    if (!video) return resolve('no-video');
+    if (video.ended) return resolve('already-ended');
+    video.addEventListener('ended', () => resolve('ended'), {once: true});
+    setTimeout(() => resolve('timeout'), timeoutMs);
+})"""
+
+# Visible Roku modal overlay that blocks interaction with the details page
+MODAL_OVERLAY_SELECTOR = ".roku-modal-overlay:not(.hidden)"
+
+# Elements that show the video player has loaded
+PLAYER_SELECTOR = "video, .roku-video-player, iframe[src*='player']"
+
+# Given [overlaySelector, closeSelectors]: returns null when no overlay is visible, else
+# clicks the first visible close button and returns its selector ('' if none matched).
+# A trailing :has-text('...') is matched case-insensitively against the element's text,
+# like Playwright's pseudo-class.
+DISMISS_MODAL_JS = """([overlaySelector, closeSelectors]) => {
+    const isVisible = (element) => {
+        const rect = element.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 &&
+            window.getComputedStyle(element).visibility !== 'hidden';
+    };
+    const overlays = Array.from(document.querySelectorAll(overlaySelector));
+    if (!overlays.some(isVisible)) return null;
+    for (const selector of closeSelectors) {
+        const match = selector.match(/^(.*):has-text\\('(.*)'\\)$/);
+        const css = match ? match[1] : selector;
+        const text = match ? match[2].toLowerCase() : null;
+        let elements;
+        try {
+            elements = document.querySelectorAll(css);
+        } catch (error) {
+            continue;
+        }
+        for (const element of elements) {
+            if (!isVisible(element)) continue;
+            if (text !== null && !element.textContent.toLowerCase().includes(text)) continue;
+            element.click();
+            return selector;
+        }
+    }
+    return '';
+}"""
+
+# Cheap snapshot of the page (title + URL) and whether its <video> is playing
+PAGE_STATE_JS = """() => {
+    const video = document.querySelector('video');
+    return {
+        fingerprint: document.title + location.href,
+        playing: !!video && !video.paused && !video.ended && video.currentTime > 0,
+    };
+}"""
+
+# Clicks the first element matching any of the given selectors and returns that selector
+CLICK_FIRST_MATCH_JS = """(selectors) => {
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (element) {
+            element.click();
+            return selector;
+        }
+    }
+    return null;
+}"""
+
+# Log message prefix for each is_movie_playing selector group
+PLAYBACK_HIT_MESSAGES = {
+    'playing': "Video element is playing",
+    'pause': "Found pause button with selector",
+    'video': "Found video element with selector",
+    'controls': "Found video controls with selector",
+    'modal': "Found modal/overlay containing video elements with selector",
+    'loading': "Found loading indicator",
+}
+
+# Pooled browsers unused for this many seconds are closed
+BROWSER_MAX_IDLE = 300
+
+LOG_FILE = 'roku_automation.log'
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Started on first use; writes log records from a background thread
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating log file with a 64 KiB buffer that is flushed only for warnings and errors"""
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=65536, encoding=self.encoding)
+        # Track the size here; the base class seeks the file to measure it, which flushes the buffer
+        self._size = stream.seek(0, os.SEEK_END)
+        # Like the base class, never rotate something that is not a regular file (e.g. /dev/null)
+        self._rotatable = os.path.isfile(self.baseFilename)
+        return stream
+        
+    def emit(self, record):
+        # Format each record once and count its encoded bytes, not characters, against maxBytes
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            size = len(msg.encode(self.stream.encoding, 'replace'))
+            if self.maxBytes > 0 and self._rotatable and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def start_log_listener():
+    """Route root logging through a queue to a process-wide background writer"""
+    global _log_listener, _queue_handler
+    log_queue = queue.SimpleQueue()
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = BufferedRotatingFileHandler(LOG_FILE, maxBytes=10_000_000, backupCount=3, delay=True)
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    _log_listener.start()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    logging.getLogger().addHandler(_queue_handler)
+
+
+def stop_log_listener():
+    """Drain queued log records and close the log file"""
+    global _log_listener, _queue_handler
+    if _log_listener is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+        _queue_handler = None
+
+
 class RokuMovieAgent:
     """Agent for automating Roku movie playback"""
     
-    def __init__(self, config: AutomationConfig):
+    # Playwright driver and browser pool shared by every agent in the process;
+    # each agent only owns its BrowserContext. Await shutdown_shared() before exit.
+    _shared_playwright = None
+    _pool = BrowserPool(max_idle=BROWSER_MAX_IDLE)
+    # Serializes driver startup so concurrent agents start it only once
+    _shared_lock: Optional[asyncio.Lock] = None
+    # Only one process can bind remote_debugging_port, so only the first Chromium launch gets it
+    _debugging_port_claimed = False
+    
+    def __init__(self, config: AutomationConfig, worker_id: Optional[int] = None,
+                 stop_event: Optional[asyncio.Event] = None):
         self.config = config
+        self.worker_id = worker_id  # Set for agents started by run_many()
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._browser_type: Optional[str] = None  # Browser actually launched (after fallbacks)
+        # True while a launch in the current setup_browser call holds remote_debugging_port
+        self._debugging_port_pending = False
+        # Selector strings are fixed per config, so build them once
+        self.play_selectors = (*ROKU_PLAY_SELECTORS, *config.play_selectors, *GENERIC_PLAY_SELECTORS)
+        self._play_union = ", ".join(self.play_selectors)
+        # Pause buttons include the configured ones, so this group is built per agent
+        self._playback_groups = [
+            selector_group("pause", (*config.pause_selectors, *PAUSE_SELECTORS)),
+            *PLAYBACK_GROUPS,
+        ]
+        # Locators built on first use for the current page (see _reset_locators)
+        self._play_locator: Optional[Locator] = None
+        self._modal_locator: Optional[Locator] = None
+        # Page fingerprint from the last successful play_movie (see _resume_if_playing)
+        self._last_state: Optional[str] = None
+        # Set by request_stop(); the agent must be created inside the running event loop
+        self._stop_event = stop_event or asyncio.Event()
         self.setup_logging()
         self.setup_screenshots_dir()
         
     def setup_logging(self):
         """Setup logging configuration"""
-        logging.basicConfig(
-            level=getattr(logging, self.config.log_level),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('roku_automation.log'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        # Log calls only enqueue records; file and console writes happen off the automation thread
+        if _log_listener is None:
+            start_log_listener()
+        logging.getLogger().setLevel(self.config.log_level_int)
+        self.logger = logging.getLogger(__name__ if self.worker_id is None else f"{__name__}.worker{self.worker_id}")
         
     def setup_screenshots_dir(self):
         """Create screenshots directory if it doesn't exist"""
         if self.config.save_screenshots:
             os.makedirs(self.config.screenshot_dir, exist_ok=True)
             
-    def setup_browser(self):
+    @classmethod
+    def _get_shared_lock(cls) -> asyncio.Lock:
+        """Lock guarding the shared driver and browsers, created inside the running event loop"""
+        if cls._shared_lock is None:
+            cls._shared_lock = asyncio.Lock()
+        return cls._shared_lock
+        
+    @classmethod
+    async def _get_shared_playwright(cls, pool_size: int = 1):
+        """Start the Playwright driver once per process, sizing the browser pool alongside it"""
+        async with cls._get_shared_lock():
+            if cls._shared_playwright is None:
+                cls._pool.size = pool_size
+                cls._shared_playwright = await async_playwright().start()
+        return cls._shared_playwright
+        
+    async def _acquire_browser(self, name: str, launch, **launch_options) -> Browser:
+        """Take a browser for name from the shared pool, launching (or connecting) one if needed"""
+        if self.browser is not None:
+            # A fallback is replacing a browser this agent already took
+            self._pool.release(self.browser)
+        browser = await self._pool.acquire(name, launch, **launch_options)
+        # Pre-launch the rest of the pool in the background so other agents find them ready;
+        # the debugging port stays with the browser launched above. A CDP endpoint is one
+        # external browser, so extra connections to it are not worth opening ahead of time
+        if name != 'cdp':
+            if 'args' in launch_options:
+                launch_options['args'] = [arg for arg in launch_options['args'] if not arg.startswith('--remote-debugging-port=')]
+            self._pool.warm_in_background(name, launch, **launch_options)
+        return browser
+        
+    @classmethod
+    async def shutdown_shared(cls):
+        """Close the pooled browsers and stop the Playwright driver"""
+        await cls._pool.close()
+        if cls._shared_playwright is not None:
+            await cls._shared_playwright.stop()
+            cls._shared_playwright = None
+        cls._shared_lock = None
+        cls._debugging_port_claimed = False
+        stop_log_listener()
+            
+    def request_stop(self):
+        """Ask run_automation to stop, cutting short the current play and any wait between loops"""
+        self._stop_event.set()
+        
+    def _install_signal_handlers(self) -> list:
+        """Turn SIGINT/SIGTERM into request_stop() so cleanup runs; returns the signals handled"""
+        loop = asyncio.get_running_loop()
+        installed = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._on_stop_signal, sig)
+                installed.append(sig)
+            except (NotImplementedError, RuntimeError):
+                # Windows event loops (and non-main threads) lack this; Ctrl+C then raises KeyboardInterrupt
+                pass
+        return installed
+        
+    def _remove_signal_handlers(self, installed: list):
+        """Restore the default handling for signals installed by _install_signal_handlers"""
+        loop = asyncio.get_running_loop()
+        for sig in installed:
+            loop.remove_signal_handler(sig)
+            
+    def _on_stop_signal(self, sig):
+        """Signal handler: stop the automation"""
+        self.logger.info("Received %s, stopping automation", signal.Signals(sig).name)
+        self.request_stop()
+        
+    async def _unless_stopped(self, coro):
+        """Await coro, cancelling it if a stop is requested first (the result is then None)"""
+        task = asyncio.ensure_future(coro)
+        stopper = asyncio.ensure_future(self._stop_event.wait())
+        try:
+            await asyncio.wait({task, stopper}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stopper.cancel()
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        return None if task.cancelled() else task.result()
+        
+    def _chrome_launch_options(self) -> dict:
+        """Launch options shared by every bundled Chromium launch"""
+        options = {
+            'headless': self.config.headless,
+            'slow_mo': self.config.slow_mo,
+            'args': CHROME_ARGS,
+        }
+        if self.config.headless:
+            # The full Chromium build runs Chrome's new headless mode, which is faster and
+            # looks like a regular browser to sites that sniff the old headless shell
+            options['channel'] = 'chromium'
+            options['args'] = CHROME_ARGS + CHROME_HEADLESS_ARGS
+        if self.config.remote_debugging_port and not RokuMovieAgent._debugging_port_claimed:
+            # Lets other runs attach to this browser with --cdp-endpoint instead of launching their own
+            RokuMovieAgent._debugging_port_claimed = self._debugging_port_pending = True
+            options['args'] = options['args'] + [f'--remote-debugging-port={self.config.remote_debugging_port}']
+            self.logger.info("Chromium accepts CDP connections at http://localhost:%s", self.config.remote_debugging_port)
+        return options
+        
+    def _release_debugging_port(self):
+        """Give remote_debugging_port back if the launch that was handed it failed, so a fallback can take it"""
+        if self._debugging_port_pending and self.browser is None and self.context is None:
+            RokuMovieAgent._debugging_port_claimed = False
+        self._debugging_port_pending = False
+        
+    def _chrome_user_data_dir(self) -> str:
+        """Profile directory for persistent Chrome contexts: the configured one, else a fresh temp dir"""
+        if self.config.user_data_dir:
+            user_data_dir = os.path.expanduser(self.config.user_data_dir)
+            if self.worker_id is not None:
+                # Chrome locks its profile, so parallel workers each get their own
+                user_data_dir = os.path.join(user_data_dir, f"worker-{self.worker_id}")
+            os.makedirs(user_data_dir, exist_ok=True)
+            return user_data_dir
+        if self.config.use_tmpfs and os.path.isdir(TMPFS_DIR):
+            # RAM-backed profile: no disk reads or writes for the cache; removed at exit
+            user_data_dir = tempfile.mkdtemp(prefix=f'roku-{os.getpid()}-', dir=TMPFS_DIR)
+            atexit.register(shutil.rmtree, user_data_dir, ignore_errors=True)
+            return user_data_dir
+        return tempfile.mkdtemp(prefix='playwright-chrome-')
+        
+    async def setup_browser(self):
         """Setup and configure the browser using Playwright with cross-platform compatibility (macOS Monterey 12.7.3 and Windows 11)"""
+        self._debugging_port_pending = False
         try:
-            self.playwright = sync_playwright().start()
-            
-            # Detect operating system
-            system = platform.system()
-            is_windows = system == 'Windows'
-            is_macos = system == 'Darwin'
-            
-            # Browser-specific user agents based on OS
-            if is_windows:
-                # Windows 11 user agents
-                user_agents = {
-                    'chrome': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'firefox': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
-                    'edge': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
-                    'safari': None  # Safari not available on Windows
-                }
-                default_browser = 'chrome'
-            elif is_macos:
-                # macOS Monterey 12.7.3 user agents
-                user_agents = {
-                    'safari': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12_7_3) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.6.6 Safari/605.1.15',
-                    'chrome': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12_7_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'firefox': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12.7; rv:121.0) Gecko/20100101 Firefox/121.0',
-                    'edge': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12_7_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0'
-                }
-                default_browser = 'safari'
-            else:
-                # Linux or other OS - use generic user agents
-                user_agents = {
-                    'chrome': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'firefox': 'Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0',
-                    'edge': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
-                    'safari': None
-                }
-                default_browser = 'chrome'
+            self.playwright = await self._get_shared_playwright(self.config.browser_pool_size)
             
             browser_type = self.config.browser.lower()
             
             # Handle Safari on non-macOS systems
-            if browser_type == 'safari' and not is_macos:
-                self.logger.warning(f"Safari is not available on {system}. Falling back to {default_browser}.")
-                browser_type = default_browser
+            if browser_type == 'safari' and not IS_MACOS and not self.config.cdp_endpoint:
+                self.logger.warning("Safari is not available on %s. Falling back to %s.", SYSTEM, DEFAULT_BROWSER)
+                browser_type = DEFAULT_BROWSER
             
             # Launch browser based on configuration with cross-platform compatibility
-            if browser_type == 'safari':
-                if not is_macos:
+            if self.config.cdp_endpoint:
+                # Attach to an already running Chromium so several agents share one browser process
+                browser_type = 'chrome'
+                self.browser = await self._acquire_browser(
+                    'cdp', self.playwright.chromium.connect_over_cdp,
+                    endpoint_url=self.config.cdp_endpoint,
+                    slow_mo=self.config.slow_mo
+                )
+                self.logger.info("Connected to shared Chromium over CDP at %s", self.config.cdp_endpoint)
+            elif browser_type == 'safari':
+                if not IS_MACOS:
                     raise ValueError("Safari is only available on macOS")
                 try:
-                    self.browser = self.playwright.webkit.launch(
+                    self.browser = await self._acquire_browser(
+                        'safari', self.playwright.webkit.launch,
                         headless=self.config.headless,
                         slow_mo=self.config.slow_mo
                     )
                     self.logger.info("Safari (WebKit) launched successfully")
                 except Exception as safari_error:
-                    self.logger.warning(f"Safari launch failed: {safari_error}")
+                    self.logger.warning("Safari launch failed: %s", safari_error)
                     self.logger.info("Falling back to Chrome/Chromium (Firefox not supported on macOS)")
                     browser_type = 'chrome'
-                    self.browser = self.playwright.chromium.launch(
-                        headless=self.config.headless,
-                        slow_mo=self.config.slow_mo,
-                        args=[
-                            '--disable-blink-features=AutomationControlled',
-                            '--disable-features=IsolateOrigins,site-per-process',
-                            '--disable-site-isolation-trials'
-                        ]
+                    self.browser = await self._acquire_browser(
+                        'chromium', self.playwright.chromium.launch,
+                        **self._chrome_launch_options()
                     )
             elif browser_type == 'chrome' or browser_type == 'chromium':
                 # On macOS, Chrome incognito mode may not be supported
-                # Use persistent context instead of incognito context
-                if is_macos:
-                    user_data_dir = tempfile.mkdtemp(prefix='playwright-chrome-')
-                    self.logger.info(f"Using persistent context for Chrome on macOS (user data dir: {user_data_dir})")
-                    
-                    # Use launch_persistent_context to avoid incognito mode
-                    chrome_args = [
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-features=IsolateOrigins,site-per-process',
-                        '--disable-site-isolation-trials'
-                    ]
-                    
-                    # Get user agent
-                    user_agent = user_agents.get('chrome') or user_agents.get(default_browser)
-                    if not user_agent:
-                        user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12_7_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                # Use persistent context instead of incognito context. A configured
+                # user_data_dir also selects this path so the disk cache and cookies
+                # survive between runs, as does use_tmpfs for a RAM-backed profile.
+                if IS_MACOS or self.config.user_data_dir or self.config.use_tmpfs:
+                    user_data_dir = self._chrome_user_data_dir()
+                    self.logger.info("Using persistent context for Chrome (user data dir: %s)", user_data_dir)
                     
                     # Create persistent context directly (avoids incognito mode)
-                    self.context = self.playwright.chromium.launch_persistent_context(
+                    self.context = await self.playwright.chromium.launch_persistent_context(
                         user_data_dir,
-                        headless=self.config.headless,
-                        slow_mo=self.config.slow_mo,
-                        args=chrome_args,
+                        **self._chrome_launch_options(),
                         viewport={'width': self.config.window_size[0], 'height': self.config.window_size[1]},
-                        user_agent=user_agent,
+                        user_agent=USER_AGENTS['chrome'],
                         locale='en-US',
-                        timezone_id='America/Los_Angeles',
+                        timezone_id=TIMEZONE,
                         extra_http_headers={
                             'Accept-Language': 'en-US,en;q=0.9',
                             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
@@ -145,13 +671,13 @@ class RokuMovieAgent:
                     )
                     # Create new page from persistent context
                     try:
-                        self.page = self.context.new_page()
+                        self.page = await self.context.new_page()
                         self.page.set_default_timeout(self.config.page_load_timeout * 1000)
                     except Exception as page_error:
                         # Handle Safari/WebKit compatibility issues
                         error_msg = str(page_error).lower()
                         if 'fixedbackgroundspaintrelativeto' in error_msg or 'unknown setting' in error_msg:
-                            self.logger.warning(f"Page creation encountered compatibility issue: {page_error}")
+                            self.logger.warning("Page creation encountered compatibility issue: %s", page_error)
                             self.logger.info("Retrying page creation with error handling...")
                             # Try to get existing pages or create a new one
                             pages = self.context.pages
@@ -160,53 +686,34 @@ class RokuMovieAgent:
                                 self.logger.info("Using existing page from context")
                             else:
                                 # Last resort: try creating page again
-                                self.page = self.context.new_page()
+                                self.page = await self.context.new_page()
                         else:
                             raise
                         self.page.set_default_timeout(self.config.page_load_timeout * 1000)
-                    self.logger.info("Successfully initialized Chrome with persistent context on macOS")
+                    self.logger.info("Successfully initialized Chrome with persistent context")
                     # Skip the regular context creation below
                     return
                 else:
                     # Non-macOS: use regular launch
-                    chrome_args = [
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-features=IsolateOrigins,site-per-process',
-                        '--disable-site-isolation-trials'
-                    ]
-                    self.browser = self.playwright.chromium.launch(
-                        headless=self.config.headless,
-                        slow_mo=self.config.slow_mo,
-                        args=chrome_args
+                    self.browser = await self._acquire_browser(
+                        'chromium', self.playwright.chromium.launch,
+                        **self._chrome_launch_options()
                     )
             elif browser_type == 'firefox':
                 # Firefox on macOS may not be supported by Playwright
-                if is_macos:
+                if IS_MACOS:
                     self.logger.warning("Firefox on macOS is not supported by Playwright. Falling back to Chrome/Chromium.")
                     browser_type = 'chrome'
                     # On macOS, Chrome incognito mode may not be supported - use persistent context
-                    user_data_dir = tempfile.mkdtemp(prefix='playwright-chrome-')
-                    self.logger.info(f"Using persistent context for Chrome on macOS (user data dir: {user_data_dir})")
-                    
-                    chrome_args = [
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-features=IsolateOrigins,site-per-process',
-                        '--disable-site-isolation-trials'
-                    ]
-                    
-                    # Get user agent
-                    user_agent = user_agents.get('chrome') or user_agents.get(default_browser)
-                    if not user_agent:
-                        user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12_7_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                    user_data_dir = self._chrome_user_data_dir()
+                    self.logger.info("Using persistent context for Chrome on macOS (user data dir: %s)", user_data_dir)
                     
                     # Create persistent context directly (avoids incognito mode)
-                    self.context = self.playwright.chromium.launch_persistent_context(
+                    self.context = await self.playwright.chromium.launch_persistent_context(
                         user_data_dir,
-                        headless=self.config.headless,
-                        slow_mo=self.config.slow_mo,
-                        args=chrome_args,
+                        **self._chrome_launch_options(),
                         viewport={'width': self.config.window_size[0], 'height': self.config.window_size[1]},
-                        user_agent=user_agent,
+                        user_agent=USER_AGENTS['chrome'],
                         locale='en-US',
                         timezone_id='America/Los_Angeles',
                         extra_http_headers={
@@ -216,13 +723,13 @@ class RokuMovieAgent:
                     )
                     # Create new page from persistent context
                     try:
-                        self.page = self.context.new_page()
+                        self.page = await self.context.new_page()
                         self.page.set_default_timeout(self.config.page_load_timeout * 1000)
                     except Exception as page_error:
                         # Handle Safari/WebKit compatibility issues
                         error_msg = str(page_error).lower()
                         if 'fixedbackgroundspaintrelativeto' in error_msg or 'unknown setting' in error_msg:
-                            self.logger.warning(f"Page creation encountered compatibility issue: {page_error}")
+                            self.logger.warning("Page creation encountered compatibility issue: %s", page_error)
                             self.logger.info("Retrying page creation with error handling...")
                             # Try to get existing pages or create a new one
                             pages = self.context.pages
@@ -231,7 +738,7 @@ class RokuMovieAgent:
                                 self.logger.info("Using existing page from context")
                             else:
                                 # Last resort: try creating page again
-                                self.page = self.context.new_page()
+                                self.page = await self.context.new_page()
                         else:
                             raise
                         self.page.set_default_timeout(self.config.page_load_timeout * 1000)
@@ -239,12 +746,14 @@ class RokuMovieAgent:
                     # Skip the regular context creation below
                     return
                 else:
-                    self.browser = self.playwright.firefox.launch(
+                    self.browser = await self._acquire_browser(
+                        'firefox', self.playwright.firefox.launch,
                         headless=self.config.headless,
                         slow_mo=self.config.slow_mo
                     )
             elif browser_type == 'edge':
-                self.browser = self.playwright.chromium.launch(
+                self.browser = await self._acquire_browser(
+                    'edge', self.playwright.chromium.launch,
                     headless=self.config.headless,
                     slow_mo=self.config.slow_mo,
                     channel='msedge',
@@ -255,84 +764,16 @@ class RokuMovieAgent:
             else:
                 raise ValueError(f"Unsupported browser: {self.config.browser}")
             
-            # Create browser context with cross-platform compatible settings
-            # Select appropriate timezone based on OS
-            timezone = 'America/Los_Angeles' if is_macos or is_windows else 'UTC'
-            
-            # Get user agent with safe fallback
-            user_agent = user_agents.get(browser_type)
-            if not user_agent:
-                user_agent = user_agents.get(default_browser)
-            if not user_agent:
-                user_agent = user_agents.get('firefox') or user_agents.get('chrome')
-            
-            context_options = {
-                'viewport': {'width': self.config.window_size[0], 'height': self.config.window_size[1]},
-                'user_agent': user_agent,
-                'locale': 'en-US',
-                'timezone_id': timezone,
-                # Extra HTTP headers for compatibility
-                'extra_http_headers': {
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-                }
-            }
-            
-            self.context = self.browser.new_context(**context_options)
-            
-            # Grant permissions for autoplay (important for video playback)
-            # Note: Safari/WebKit doesn't support the 'autoplay' permission API
-            # Only grant for Chromium-based browsers (Chrome, Edge) and Firefox
-            if browser_type not in ['safari']:
-                try:
-                    base_url = self.config.movie_url.split('/details')[0]
-                    self.context.grant_permissions(['autoplay'], origin=base_url)
-                    self.logger.debug(f"Granted autoplay permissions for {base_url}")
-                except Exception as perm_error:
-                    self.logger.warning(f"Could not grant permissions: {perm_error}")
-            else:
-                self.logger.debug("Safari/WebKit doesn't support autoplay permission API - skipping permission grant")
+            self._browser_type = browser_type
+            await self._new_session()
             
-            # Create new page
-            try:
-                self.page = self.context.new_page()
-                self.page.set_default_timeout(self.config.page_load_timeout * 1000)  # Playwright uses milliseconds
-            except Exception as page_error:
-                # Handle Safari/WebKit compatibility issues with unknown settings
-                error_msg = str(page_error).lower()
-                if 'fixedbackgroundspaintrelativeto' in error_msg or 'unknown setting' in error_msg:
-                    self.logger.warning(f"Page creation encountered compatibility issue: {page_error}")
-                    self.logger.info("This is a known Safari/WebKit compatibility issue. Attempting workaround...")
-                    # Try to get existing pages from context (some contexts auto-create a page)
-                    pages = self.context.pages
-                    if pages:
-                        self.page = pages[0]
-                        self.logger.info("Using existing page from context")
-                    else:
-                        # For Safari, try creating page with minimal settings
-                        # The error is internal to Playwright, so we'll try again
-                        self.logger.info("Retrying page creation...")
-                        try:
-                            self.page = self.context.new_page()
-                        except Exception as retry_error:
-                            # If it still fails, this might be a Playwright version issue
-                            self.logger.error(f"Page creation failed after retry: {retry_error}")
-                            self.logger.error("This may be a Playwright version compatibility issue with Safari/WebKit")
-                            raise RuntimeError(
-                                f"Failed to create page due to Safari/WebKit compatibility issue: {retry_error}. "
-                                "Try updating Playwright: pip install --upgrade playwright && playwright install"
-                            ) from retry_error
-                    self.page.set_default_timeout(self.config.page_load_timeout * 1000)
-                else:
-                    raise
-            
-            os_name = "Windows 11" if is_windows else ("macOS Monterey" if is_macos else system)
-            self.logger.info(f"Successfully initialized {browser_type} browser with Playwright on {os_name}")
+            self.logger.info("Successfully initialized %s browser with Playwright on %s", browser_type, OS_NAME)
             
         except Exception as e:
+            self._release_debugging_port()
             error_msg = str(e).lower()
-            self.logger.error(f"Failed to setup browser: {e}")
-            self.logger.error(f"Browser: {self.config.browser}, Error type: {type(e).__name__}")
+            self.logger.error("Failed to setup browser: %s", e)
+            self.logger.error("Browser: %s, Error type: %s", self.config.browser, type(e).__name__)
             
             # Check if it's a Firefox on macOS error or Chrome incognito error
             if ('firefox' in error_msg and 'macos' in error_msg and 'not supported' in error_msg) or \
@@ -341,63 +782,57 @@ class RokuMovieAgent:
                 try:
                     browser_type = 'chrome'
                     # Use persistent context to avoid incognito mode issues on macOS
-                    user_data_dir = tempfile.mkdtemp(prefix='playwright-chrome-')
-                    self.logger.info(f"Using persistent context for Chrome on macOS (user data dir: {user_data_dir})")
-                    
-                    chrome_args = [
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-features=IsolateOrigins,site-per-process',
-                        '--disable-site-isolation-trials'
-                    ]
-                    
+                    user_data_dir = self._chrome_user_data_dir()
+                    self.logger.info("Using persistent context for Chrome on macOS (user data dir: %s)", user_data_dir)
                     # Get appropriate user agent for Chrome on macOS
-                    fallback_ua = user_agents.get('chrome') or 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12_7_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                    fallback_ua = USER_AGENTS['chrome']
                     
                     # Create persistent context directly (avoids incognito mode)
-                    self.context = self.playwright.chromium.launch_persistent_context(
+                    self.context = await self.playwright.chromium.launch_persistent_context(
                         user_data_dir,
-                        headless=self.config.headless,
-                        slow_mo=self.config.slow_mo,
-                        args=chrome_args,
+                        **self._chrome_launch_options(),
                         viewport={'width': self.config.window_size[0], 'height': self.config.window_size[1]},
                         user_agent=fallback_ua,
                         locale='en-US',
-                        timezone_id='America/Los_Angeles' if is_macos else 'UTC',
+                        timezone_id=TIMEZONE,
                         extra_http_headers={
                             'Accept-Language': 'en-US,en;q=0.9',
                             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
                         }
                     )
                     try:
-                        self.page = self.context.new_page()
+                        self.page = await self.context.new_page()
                         self.page.set_default_timeout(self.config.page_load_timeout * 1000)
                     except Exception as page_error:
                         # Handle Safari/WebKit compatibility issues
                         error_msg = str(page_error).lower()
                         if 'fixedbackgroundspaintrelativeto' in error_msg or 'unknown setting' in error_msg:
-                            self.logger.warning(f"Page creation encountered compatibility issue: {page_error}")
+                            self.logger.warning("Page creation encountered compatibility issue: %s", page_error)
                             pages = self.context.pages
                             if pages:
                                 self.page = pages[0]
                             else:
-                                self.page = self.context.new_page()
+                                self.page = await self.context.new_page()
                         else:
                             raise
                         self.page.set_default_timeout(self.config.page_load_timeout * 1000)
                     self.logger.info("Successfully initialized Chrome/Chromium with persistent context as fallback browser")
                     return
                 except Exception as chrome_fallback_error:
-                    self.logger.error(f"Chrome fallback also failed: {chrome_fallback_error}")
+                    self._release_debugging_port()
+                    self.logger.error("Chrome fallback also failed: %s", chrome_fallback_error)
                     # Try Safari as last resort on macOS
-                    if is_macos:
+                    if IS_MACOS:
                         try:
                             self.logger.info("Attempting Safari as final fallback...")
-                            self.browser = self.playwright.webkit.launch(
+                            self.browser = await self._acquire_browser(
+                                'safari', self.playwright.webkit.launch,
                                 headless=self.config.headless,
                                 slow_mo=self.config.slow_mo
                             )
-                            safari_ua = user_agents.get('safari') or 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12_7_3) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.6.6 Safari/605.1.15'
-                            self.context = self.browser.new_context(
+                            self._browser_type = 'safari'
+                            safari_ua = USER_AGENTS['safari']
+                            self.context = await self.browser.new_context(
                                 viewport={'width': self.config.window_size[0], 'height': self.config.window_size[1]},
                                 user_agent=safari_ua,
                                 locale='en-US',
@@ -408,13 +843,13 @@ class RokuMovieAgent:
                                 }
                             )
                             try:
-                                self.page = self.context.new_page()
+                                self.page = await self.context.new_page()
                                 self.page.set_default_timeout(self.config.page_load_timeout * 1000)
                             except Exception as page_error:
                                 # Handle Safari/WebKit compatibility issues with unknown settings
                                 error_msg = str(page_error).lower()
                                 if 'fixedbackgroundspaintrelativeto' in error_msg or 'unknown setting' in error_msg:
-                                    self.logger.warning(f"Safari page creation encountered compatibility issue: {page_error}")
+                                    self.logger.warning("Safari page creation encountered compatibility issue: %s", page_error)
                                     self.logger.info("This is a known Safari/WebKit compatibility issue. Attempting workaround...")
                                     pages = self.context.pages
                                     if pages:
@@ -422,57 +857,50 @@ class RokuMovieAgent:
                                         self.logger.info("Using existing page from context")
                                     else:
                                         # Try one more time
-                                        self.page = self.context.new_page()
+                                        self.page = await self.context.new_page()
                                 else:
                                     raise
                                 self.page.set_default_timeout(self.config.page_load_timeout * 1000)
                             self.logger.info("Successfully initialized Safari as fallback browser")
                             return
                         except Exception as safari_fallback_error:
-                            self.logger.error(f"Safari fallback also failed: {safari_fallback_error}")
+                            self.logger.error("Safari fallback also failed: %s", safari_fallback_error)
                     raise
             
             # Try Firefox as fallback (only on non-macOS systems)
-            if self.config.browser.lower() != 'firefox' and not is_macos:
+            if self.config.browser.lower() != 'firefox' and not IS_MACOS:
                 self.logger.info("Attempting fallback to Firefox...")
                 try:
-                    self.browser = self.playwright.firefox.launch(
+                    self.browser = await self._acquire_browser(
+                        'firefox', self.playwright.firefox.launch,
                         headless=self.config.headless,
                         slow_mo=self.config.slow_mo
                     )
+                    self._browser_type = 'firefox'
                     # Get appropriate user agent for fallback
-                    fallback_ua = user_agents.get('firefox') or 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0'
-                    self.context = self.browser.new_context(
+                    fallback_ua = USER_AGENTS['firefox']
+                    self.context = await self.browser.new_context(
                         viewport={'width': self.config.window_size[0], 'height': self.config.window_size[1]},
                         user_agent=fallback_ua
                     )
-                    self.page = self.context.new_page()
+                    self.page = await self.context.new_page()
                     self.page.set_default_timeout(self.config.page_load_timeout * 1000)
                     self.logger.info("Successfully initialized Firefox as fallback browser")
                 except Exception as fallback_error:
-                    self.logger.error(f"Firefox fallback also failed: {fallback_error}")
+                    self.logger.error("Firefox fallback also failed: %s", fallback_error)
                     raise
-            elif is_macos and self.config.browser.lower() == 'firefox':
+            elif IS_MACOS and self.config.browser.lower() == 'firefox':
                 # On macOS, try Chrome or Safari instead - use persistent context to avoid incognito issues
                 self.logger.info("Firefox not supported on macOS. Attempting Chrome/Chromium with persistent context...")
                 try:
-                    user_data_dir = tempfile.mkdtemp(prefix='playwright-chrome-')
-                    self.logger.info(f"Using persistent context for Chrome on macOS (user data dir: {user_data_dir})")
-                    
-                    chrome_args = [
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-features=IsolateOrigins,site-per-process',
-                        '--disable-site-isolation-trials'
-                    ]
-                    
-                    chrome_ua = user_agents.get('chrome') or 'Mozilla/5.0 (Macintosh; Intel Mac OS X 12_7_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                    user_data_dir = self._chrome_user_data_dir()
+                    self.logger.info("Using persistent context for Chrome on macOS (user data dir: %s)", user_data_dir)
+                    chrome_ua = USER_AGENTS['chrome']
                     
                     # Create persistent context directly (avoids incognito mode)
-                    self.context = self.playwright.chromium.launch_persistent_context(
+                    self.context = await self.playwright.chromium.launch_persistent_context(
                         user_data_dir,
-                        headless=self.config.headless,
-                        slow_mo=self.config.slow_mo,
-                        args=chrome_args,
+                        **self._chrome_launch_options(),
                         viewport={'width': self.config.window_size[0], 'height': self.config.window_size[1]},
                         user_agent=chrome_ua,
                         locale='en-US',
@@ -483,282 +911,250 @@ class RokuMovieAgent:
                         }
                     )
                     try:
-                        self.page = self.context.new_page()
+                        self.page = await self.context.new_page()
                         self.page.set_default_timeout(self.config.page_load_timeout * 1000)
                     except Exception as page_error:
                         # Handle Safari/WebKit compatibility issues
                         error_msg = str(page_error).lower()
                         if 'fixedbackgroundspaintrelativeto' in error_msg or 'unknown setting' in error_msg:
-                            self.logger.warning(f"Page creation encountered compatibility issue: {page_error}")
+                            self.logger.warning("Page creation encountered compatibility issue: %s", page_error)
                             pages = self.context.pages
                             if pages:
                                 self.page = pages[0]
                             else:
-                                self.page = self.context.new_page()
+                                self.page = await self.context.new_page()
                         else:
                             raise
                         self.page.set_default_timeout(self.config.page_load_timeout * 1000)
                     self.logger.info("Successfully initialized Chrome/Chromium with persistent context as fallback for Firefox on macOS")
                     return
                 except Exception as chrome_error:
-                    self.logger.error(f"Chrome fallback failed: {chrome_error}")
+                    self._release_debugging_port()
+                    self.logger.error("Chrome fallback failed: %s", chrome_error)
                     raise
             else:
                 raise
             
-    def take_screenshot(self, name: str):
+    async def _new_session(self):
+        """Open a fresh context and page on the launched browser"""
+        # Create browser context with cross-platform compatible settings
+        # Get user agent with safe fallback
+        browser_type = self._browser_type
+        user_agent = USER_AGENTS.get(browser_type) or USER_AGENTS.get(DEFAULT_BROWSER) or USER_AGENTS['chrome']
+        
+        context_options = {
+            'viewport': {'width': self.config.window_size[0], 'height': self.config.window_size[1]},
+            'user_agent': user_agent,
+            'locale': 'en-US',
+            'timezone_id': TIMEZONE,
+            # Extra HTTP headers for compatibility
+            'extra_http_headers': {
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
+            }
+        }
+        
+        self.context = await self.browser.new_context(**context_options)
+        
+        # Grant permissions for autoplay (important for video playback)
+        # Note: Safari/WebKit doesn't support the 'autoplay' permission API
+        # Only grant for Chromium-based browsers (Chrome, Edge) and Firefox
+        if browser_type not in ['safari']:
+            try:
+                base_url = self.config.movie_url.split('/details')[0]
+                await self.context.grant_permissions(['autoplay'], origin=base_url)
+                self.logger.debug("Granted autoplay permissions for %s", base_url)
+            except Exception as perm_error:
+                self.logger.warning("Could not grant permissions: %s", perm_error)
+        else:
+            self.logger.debug("Safari/WebKit doesn't support autoplay permission API - skipping permission grant")
+        
+        # Create new page
+        try:
+            self.page = await self.context.new_page()
+            self.page.set_default_timeout(self.config.page_load_timeout * 1000)  # Playwright uses milliseconds
+        except Exception as page_error:
+            # Handle Safari/WebKit compatibility issues with unknown settings
+            error_msg = str(page_error).lower()
+            if 'fixedbackgroundspaintrelativeto' in error_msg or 'unknown setting' in error_msg:
+                self.logger.warning("Page creation encountered compatibility issue: %s", page_error)
+                self.logger.info("This is a known Safari/WebKit compatibility issue. Attempting workaround...")
+                # Try to get existing pages from context (some contexts auto-create a page)
+                pages = self.context.pages
+                if pages:
+                    self.page = pages[0]
+                    self.logger.info("Using existing page from context")
+                else:
+                    # For Safari, try creating page with minimal settings
+                    # The error is internal to Playwright, so we'll try again
+                    self.logger.info("Retrying page creation...")
+                    try:
+                        self.page = await self.context.new_page()
+                    except Exception as retry_error:
+                        # If it still fails, this might be a Playwright version issue
+                        self.logger.error("Page creation failed after retry: %s", retry_error)
+                        self.logger.error("This may be a Playwright version compatibility issue with Safari/WebKit")
+                        raise RuntimeError(
+                            f"Failed to create page due to Safari/WebKit compatibility issue: {retry_error}. "
+                            "Try updating Playwright: pip install --upgrade playwright && playwright install"
+                        ) from retry_error
+                self.page.set_default_timeout(self.config.page_load_timeout * 1000)
+            else:
+                raise
+        
+            
+    async def _close_session(self):
+        """Close the current context and its page; the browser keeps running"""
+        if self.context:
+            await self.context.close()
+        self.context = None
+        self.page = None
+        self._last_state = None
+        self._reset_locators()
+            
+    async def _block_heavy_resources(self, route):
+        """Route handler that aborts image, font and media requests"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+            
+    async def take_screenshot(self, name: str):
         """Take a screenshot for debugging"""
         if self.config.save_screenshots and self.page:
             timestamp = int(time.time())
+            if self.worker_id is not None:
+                name = f"worker{self.worker_id}_{name}"
             filename = f"{self.config.screenshot_dir}/{name}_{timestamp}.png"
-            self.page.screenshot(path=filename)
-            self.logger.info(f"Screenshot saved: {filename}")
+            await self.page.screenshot(path=filename)
+            self.logger.info("Screenshot saved: %s", filename)
             
-    def wait_for_element(self, selector: str, timeout: int = None) -> bool:
+    async def wait_for_element(self, selector: str, timeout: int = None) -> bool:
         """Wait for an element to be present and clickable"""
         timeout_ms = (timeout or self.config.element_wait_timeout) * 1000  # Convert to milliseconds
         try:
-            self.page.wait_for_selector(selector, timeout=timeout_ms, state='visible')
+            await self.page.wait_for_selector(selector, timeout=timeout_ms, state='visible')
             return True
         except PlaywrightTimeoutError:
-            self.logger.warning(f"Element not found: {selector}")
+            self.logger.warning("Element not found: %s", selector)
             return False
             
-    def find_play_button(self) -> bool:
-        """Find and click the play button"""
+    async def _click(self, click, expect_nav: bool):
+        """Run click(); with expect_nav, also wait for the navigation to the player page it triggers"""
+        if not expect_nav:
+            await click()
+            return
+        clicked = False
+        try:
+            # Listening before the click cannot miss a navigation that fires immediately
+            async with self.page.expect_navigation(url=WATCH_URL_PATTERN, timeout=10000, wait_until='domcontentloaded'):
+                await click()
+                clicked = True
+            self.logger.info("Successfully navigated to video player page")
+        except PlaywrightTimeoutError:
+            if not clicked:
+                raise
+            self.logger.info("No navigation detected, continuing with current page")
+            
+    async def find_play_button(self, expect_nav: bool = False) -> bool:
+        """Find and click the play button; with expect_nav, also wait for the player page to load"""
         try:
             # Try multiple selectors for play button, including Roku-specific ones
-            selectors = [
-                # Roku-specific selectors
-                "a.roku-button.icon-play",
-                "a[aria-label*='Play Ice Cross']",
-                "a[href*='/watch/']",
-                ".roku-button.padded.icon-play",
-                # Generic selectors
-                self.config.play_button_selector,
-                "button[aria-label*='play']",
-                "button[aria-label*='Play']",
-                ".play-button",
-                "[data-testid*='play']",
-                "button:has-text('Play')",
-                "button:has-text('play')",
-                "a:has-text('Play')"
-            ]
+            selectors = self.play_selectors
             
+            # Wait once for any candidate to become visible (a single selector union)
+            try:
+                await self._get_play_locator().wait_for(state='visible', timeout=self.config.element_wait_timeout * 1000)
+            except PlaywrightTimeoutError:
+                self.logger.error("Could not find play button with any selector")
+                return False
+            
+            # The union matches in document order, so pick the highest-priority
+            # selector that is visible now; these checks do not wait
             for selector in selectors:
                 try:
-                    if self.wait_for_element(selector, 5):
-                        # Get the element and try different click methods
-                        element = self.page.locator(selector)
-                        
-                        # Try regular click first
-                        try:
-                            element.click()
-                            self.logger.info(f"Successfully clicked play button with selector: {selector}")
-                            return True
-                        except Exception as click_error:
-                            self.logger.debug(f"Regular click failed for {selector}: {click_error}")
-                            
-                            # Try force click
-                            try:
-                                element.click(force=True)
-                                self.logger.info(f"Successfully force-clicked play button with selector: {selector}")
-                                return True
-                            except Exception as force_error:
-                                self.logger.debug(f"Force click failed for {selector}: {force_error}")
-                                
-                                # Try JavaScript click
-                                try:
-                                    element.evaluate("element => element.click()")
-                                    self.logger.info(f"Successfully JS-clicked play button with selector: {selector}")
-                                    return True
-                                except Exception as js_error:
-                                    self.logger.debug(f"JS click failed for {selector}: {js_error}")
-                                    continue
+                    element = self.page.locator(selector).filter(visible=True).first
+                    if await element.count() > 0:
+                        # force skips actionability checks, so a bad match costs at most 2 seconds
+                        await self._click(lambda: element.click(force=True, timeout=2000), expect_nav)
+                        self.logger.info("Successfully clicked play button with selector: %s", selector)
+                        return True
                 except Exception as e:
-                    self.logger.debug(f"Selector {selector} failed: {e}")
+                    self.logger.debug("Selector %s failed: %s", selector, e)
                     continue
+            
+            # Last resort: a single in-page JavaScript click over the plain CSS selectors
+            css_selectors = [selector for selector in selectors if ':has-text(' not in selector]
+            
+            async def js_click():
+                nonlocal clicked
+                clicked = await self.page.evaluate(CLICK_FIRST_MATCH_JS, css_selectors)
+                if not clicked:
+                    # Leave the navigation wait straight away; nothing was clicked
+                    raise LookupError("no element matched")
+            
+            clicked = None
+            try:
+                await self._click(js_click, expect_nav)
+            except LookupError:
+                pass
+            if clicked:
+                self.logger.info("Successfully JS-clicked play button with selector: %s", clicked)
+                return True
                     
             self.logger.error("Could not find play button with any selector")
             return False
             
         except Exception as e:
-            self.logger.error(f"Error finding play button: {e}")
+            self.logger.error("Error finding play button: %s", e)
             return False
             
-    def is_movie_playing(self) -> bool:
+    async def is_movie_playing(self) -> bool:
         """Check if the movie is currently playing"""
+        # If not on watch page, video is definitely not playing
+        if "/watch/" not in self.page.url:
+            return False
+            
         try:
-            # First check if we're on the watch page
-            current_url = self.page.url
-            if "/watch/" in current_url:
-                self.logger.info("On watch page, checking for video elements...")
-                
-                # Look for pause button or video controls
-                pause_selectors = [
-                    self.config.pause_button_selector,
-                    "button[aria-label*='pause']",
-                    "button[aria-label*='Pause']",
-                    ".pause-button",
-                    "[data-testid*='pause']",
-                    # Roku-specific selectors
-                    ".roku-button.icon-pause",
-                    "a[aria-label*='Pause']",
-                    ".roku-button[aria-label*='pause']"
-                ]
-                
-                for selector in pause_selectors:
-                    try:
-                        if self.page.locator(selector).is_visible():
-                            self.logger.info(f"Found pause button with selector: {selector}")
-                            return True
-                    except:
-                        continue
-                
-                # Check for video element or player (more comprehensive)
-                video_selectors = [
-                    "video",
-                    ".video-player",
-                    ".player",
-                    "[data-testid*='video']",
-                    ".roku-video-player",
-                    # Additional selectors for embedded players
-                    "iframe[src*='player']",
-                    "iframe[src*='video']",
-                    ".embed-player",
-                    ".media-player",
-                    "[class*='player']",
-                    "[class*='video']",
-                    # Roku-specific video containers
-                    ".roku-player",
-                    ".roku-video-container",
-                    ".video-container"
-                ]
-                
-                for selector in video_selectors:
-                    try:
-                        if self.page.locator(selector).is_visible():
-                            self.logger.info(f"Found video element with selector: {selector}")
-                            return True
-                    except:
-                        continue
-                
-                # Check for video controls or progress bars
-                control_selectors = [
-                    ".progress-bar",
-                    ".seek-bar",
-                    ".time-display",
-                    "[class*='progress']",
-                    "[class*='seek']",
-                    ".video-controls",
-                    ".player-controls",
-                    # Roku-specific controls
-                    ".roku-controls",
-                    ".roku-progress-bar",
-                    ".roku-time-display"
-                ]
-                
-                for selector in control_selectors:
-                    try:
-                        if self.page.locator(selector).is_visible():
-                            self.logger.info(f"Found video controls with selector: {selector}")
-                            return True
-                    except:
-                        continue
-                
-                # Check for any modal or overlay that might contain the video
-                modal_selectors = [
-                    ".modal",
-                    ".overlay",
-                    ".popup",
-                    "[class*='modal']",
-                    "[class*='overlay']",
-                    ".video-modal",
-                    ".player-modal",
-                    ".roku-modal"
-                ]
-                
-                for selector in modal_selectors:
-                    try:
-                        if self.page.locator(selector).is_visible():
-                            self.logger.info(f"Found modal/overlay with selector: {selector}")
-                            # Check if this modal contains video elements
-                            modal = self.page.locator(selector)
-                            if modal.locator("video").count() > 0 or modal.locator("iframe").count() > 0:
-                                self.logger.info("Modal contains video elements")
-                                return True
-                    except:
-                        continue
-                
-                # If we're on watch page but no video elements found, 
-                # check if there's a loading indicator
-                loading_selectors = [
-                    ".loading",
-                    ".spinner",
-                    "[class*='loading']",
-                    "[class*='spinner']",
-                    ".roku-loading"
-                ]
-                
-                for selector in loading_selectors:
-                    try:
-                        if self.page.locator(selector).is_visible():
-                            self.logger.info(f"Found loading indicator: {selector}")
-                            return True  # Assume video is loading/playing
-                    except:
-                        continue
-                
-                # If we're on watch page and no specific elements found,
-                # assume video is playing (Roku might use custom video implementation)
-                self.logger.info("On watch page with no specific video elements detected, assuming video is playing")
-                return True
+            self.logger.info("On watch page, checking for video elements...")
             
-            # If not on watch page, video is definitely not playing
-            return False
+            # A playing <video> settles it; otherwise look for a pause button, the
+            # video/player, its controls, a modal containing the video, or a loading
+            # indicator - in that order - all within the same in-page call
+            hit = await self.page.evaluate(DETECT_PLAYBACK_JS, self._playback_groups)
+            if hit:
+                self.logger.info("%s: %s", PLAYBACK_HIT_MESSAGES[hit['group']], hit['selector'])
+                return True  # Loading indicators also count: assume video is loading/playing
+            
+            # If we're on watch page and no specific elements found,
+            # assume video is playing (Roku might use custom video implementation)
+            self.logger.info("On watch page with no specific video elements detected, assuming video is playing")
+            return True
             
         except Exception as e:
-            self.logger.error(f"Error checking if movie is playing: {e}")
+            self.logger.error("Error checking if movie is playing: %s", e)
             return False
             
-    def analyze_page_structure(self):
+    async def analyze_page_structure(self):
         """Analyze the page structure to find video elements"""
         try:
             self.logger.info("=== PAGE STRUCTURE ANALYSIS ===")
             
-            # Check for video elements
-            video_count = self.page.locator("video").count()
-            self.logger.info(f"Video elements found: {video_count}")
+            # Gather every count (and the title) in a single in-page call
+            report = await self.page.evaluate(PAGE_STRUCTURE_JS, list(PLAYER_CLASSES))
             
-            # Check for iframes
-            iframe_count = self.page.locator("iframe").count()
-            self.logger.info(f"IFrame elements found: {iframe_count}")
+            self.logger.info("Video elements found: %s", report['video'])
+            self.logger.info("IFrame elements found: %s", report['iframe'])
             
-            # Check for common video player classes
-            player_classes = [
-                "video-player", "player", "media-player", "embed-player",
-                "roku-video-player", "video-container", "player-container"
-            ]
-            
-            for class_name in player_classes:
-                count = self.page.locator(f".{class_name}").count()
+            # Common video player classes
+            for class_name, count in report['playerClasses'].items():
                 if count > 0:
-                    self.logger.info(f"Found {count} elements with class '{class_name}'")
-            
-            # Check for modals and overlays
-            modal_count = self.page.locator(".modal, .overlay, .popup").count()
-            self.logger.info(f"Modal/overlay elements found: {modal_count}")
-            
-            # Check for any elements with 'video' or 'player' in class names
-            video_elements = self.page.locator("[class*='video'], [class*='player']").count()
-            self.logger.info(f"Elements with 'video' or 'player' in class: {video_elements}")
+                    self.logger.info("Found %d elements with class '%s'", count, class_name)
             
-            # Check for any elements with 'play' or 'pause' in class names
-            control_elements = self.page.locator("[class*='play'], [class*='pause']").count()
-            self.logger.info(f"Elements with 'play' or 'pause' in class: {control_elements}")
-            
-            # Check page title
-            title = self.page.title()
-            self.logger.info(f"Page title: {title}")
+            self.logger.info("Modal/overlay elements found: %s", report['modal'])
+            self.logger.info("Elements with 'video' or 'player' in class: %s", report['videoOrPlayer'])
+            self.logger.info("Elements with 'play' or 'pause' in class: %s", report['playOrPause'])
+            self.logger.info("Page title: %s", report['title'])
             
             # Check for any JavaScript errors or console messages
             # (This would require additional setup in Playwright)
@@ -766,227 +1162,322 @@ class RokuMovieAgent:
             self.logger.info("=== END PAGE ANALYSIS ===")
             
         except Exception as e:
-            self.logger.error(f"Error analyzing page structure: {e}")
+            self.logger.error("Error analyzing page structure: %s", e)
 
-    def wait_for_movie_completion(self):
+    async def wait_for_movie_completion(self):
         """Wait for the movie to finish playing"""
         self.logger.info("Waiting for movie to complete...")
-        start_time = time.time()
         
-        while True:
-            if not self.is_movie_playing():
-                self.logger.info("Movie appears to have finished")
-                break
-                
-            # Check if we've been waiting too long (safety timeout)
-            if time.time() - start_time > 3600:  # 1 hour timeout
-                self.logger.warning("Movie timeout reached, assuming completion")
-                break
-                
-            time.sleep(10)  # Check every 10 seconds
+        # Await the <video> element's 'ended' event inside the page: one call for the whole movie
+        try:
+            status = await self.page.evaluate(WAIT_FOR_VIDEO_END_JS, MOVIE_TIMEOUT_MS)
+        except Exception as e:
+            # Leaving the player page destroys the execution context the promise lives in
+            self.logger.info("Player page went away while waiting (%s), assuming completion", e)
+            return
+        
+        if status == 'timeout':
+            self.logger.warning("Movie timeout reached, assuming completion")
+            return
+        if status != 'no-video':
+            self.logger.info("Movie appears to have finished (%s)", status)
+            return
+        
+        # No <video> element (custom or embedded player): wait in the page until we leave
+        # the watch page or a video shows up and ends
+        try:
+            await self.page.wait_for_function(
+                """() => {
+                    if (!location.pathname.includes('/watch/')) return true;
+                    const video = document.querySelector('video');
+                    return !!video && video.ended;
+                }""",
+                polling=1000,
+                timeout=MOVIE_TIMEOUT_MS
+            )
+            self.logger.info("Movie appears to have finished")
+        except PlaywrightTimeoutError:
+            self.logger.warning("Movie timeout reached, assuming completion")
+        except Exception as e:
+            self.logger.warning("Stopped waiting for movie completion: %s", e)
             
-    def handle_modal_overlay(self) -> bool:
+    def _get_play_locator(self) -> Locator:
+        """Locator for the first visible play button candidate, built once per page"""
+        if self._play_locator is None:
+            self._play_locator = self.page.locator(self._play_union).filter(visible=True).first
+        return self._play_locator
+        
+    def _get_modal_locator(self) -> Locator:
+        """Locator for the blocking modal overlay, built once per page"""
+        if self._modal_locator is None:
+            self._modal_locator = self.page.locator(MODAL_OVERLAY_SELECTOR)
+        return self._modal_locator
+        
+    def _reset_locators(self):
+        """Drop cached locators so they are rebuilt against the current page"""
+        self._play_locator = None
+        self._modal_locator = None
+        
+    async def wait_for_modal_hidden(self, timeout_ms: int = 2000) -> bool:
+        """Wait for the blocking modal overlay to disappear"""
+        try:
+            await self._get_modal_locator().first.wait_for(state='hidden', timeout=timeout_ms)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+            
+    async def handle_modal_overlay(self) -> bool:
         """Handle any modal overlays that might block interaction"""
         try:
-            # Check if there's a visible modal overlay present (not hidden)
-            modal_overlay = self.page.locator(".roku-modal-overlay:not(.hidden)")
-            if modal_overlay.count() == 0 or not modal_overlay.first.is_visible():
+            modal_overlay = self._get_modal_locator()
+            
+            # Check for a visible overlay and click the first visible close button in a
+            # single in-page call instead of an is_visible()/click() round-trip per selector
+            closed_with = await self.page.evaluate(DISMISS_MODAL_JS, [MODAL_OVERLAY_SELECTOR, list(MODAL_CLOSE_SELECTORS)])
+            if closed_with is None:
                 return False
                 
             self.logger.info("Modal overlay detected, attempting to dismiss...")
-            
-            # Look for common modal close buttons
-            modal_selectors = [
-                # Specific to anonymous-nudge modal
-                ".roku-modal-overlay.anonymous-nudge .close",
-                ".roku-modal-overlay.anonymous-nudge button[aria-label*='close']",
-                ".roku-modal-overlay.anonymous-nudge button[aria-label*='Close']",
-                ".roku-modal-overlay.anonymous-nudge .close-button",
-                ".roku-modal-overlay.anonymous-nudge button[data-testid*='close']",
-                ".roku-modal-overlay.anonymous-nudge .modal-close",
-                # Look for X button or close symbol
-                ".roku-modal-overlay.anonymous-nudge [aria-label='Close']",
-                ".roku-modal-overlay.anonymous-nudge [aria-label='close']",
-                ".roku-modal-overlay.anonymous-nudge button:has-text('×')",
-                ".roku-modal-overlay.anonymous-nudge button:has-text('✕')",
-                # Generic modal close buttons
-                ".roku-modal-overlay .close",
-                ".roku-modal-overlay button[aria-label*='close']",
-                ".roku-modal-overlay button[aria-label*='Close']",
-                ".roku-modal-overlay .close-button",
-                ".roku-modal-overlay button[data-testid*='close']",
-                ".roku-modal-overlay .modal-close",
-                # Roku-specific selectors
-                ".roku-modal-overlay .roku-button[aria-label*='close']",
-                ".roku-modal-overlay .roku-button[aria-label*='Close']",
-                # Generic close buttons
-                ".roku-modal-overlay button:has-text('Close')",
-                ".roku-modal-overlay button:has-text('close')",
-                ".roku-modal-overlay [role='button']:has-text('Close')",
-                ".roku-modal-overlay [role='button']:has-text('close')"
-            ]
-            
-            for selector in modal_selectors:
-                try:
-                    close_button = self.page.locator(selector)
-                    if close_button.is_visible():
-                        close_button.click()
-                        self.logger.info(f"Closed modal with selector: {selector}")
-                        time.sleep(2)  # Wait for modal to close
-                        return True
-                except Exception as e:
-                    self.logger.debug(f"Close button {selector} failed: {e}")
-                    continue
+            if closed_with:
+                self.logger.info("Closed modal with selector: %s", closed_with)
+                if await self.wait_for_modal_hidden():
+                    return True
             
             # Try pressing Escape key
             try:
-                self.page.keyboard.press("Escape")
+                await self.page.keyboard.press("Escape")
                 self.logger.info("Pressed Escape key to dismiss modal")
-                time.sleep(2)
-                if modal_overlay.count() == 0 or not modal_overlay.first.is_visible():
+                if await self.wait_for_modal_hidden():
                     return True
             except Exception as e:
-                self.logger.debug(f"Escape key failed: {e}")
+                self.logger.debug("Escape key failed: %s", e)
             
             # If no close button found, try clicking outside the modal
             try:
                 # Click on the page background to dismiss modal
-                self.page.click("body", position={"x": 10, "y": 10})
+                await self.page.click("body", position={"x": 10, "y": 10})
                 self.logger.info("Clicked outside modal to dismiss")
-                time.sleep(2)
-                if modal_overlay.count() == 0 or not modal_overlay.first.is_visible():
+                if await self.wait_for_modal_hidden():
                     return True
             except Exception as e:
-                self.logger.debug(f"Click outside modal failed: {e}")
+                self.logger.debug("Click outside modal failed: %s", e)
             
             # Try clicking on the modal overlay itself (sometimes this dismisses it)
             try:
-                modal_overlay.first.click()
+                await modal_overlay.first.click()
                 self.logger.info("Clicked on modal overlay to dismiss")
-                time.sleep(2)
-                if modal_overlay.count() == 0 or not modal_overlay.first.is_visible():
+                if await self.wait_for_modal_hidden():
                     return True
             except Exception as e:
-                self.logger.debug(f"Click on modal overlay failed: {e}")
+                self.logger.debug("Click on modal overlay failed: %s", e)
                 
             self.logger.warning("Could not dismiss modal overlay")
             return False
             
         except Exception as e:
-            self.logger.warning(f"Error handling modal overlay: {e}")
+            self.logger.warning("Error handling modal overlay: %s", e)
             return False
 
-    def play_movie(self) -> bool:
+    async def _page_state(self) -> dict:
+        """Fingerprint of the current page and whether its video is playing"""
+        return await self.page.evaluate(PAGE_STATE_JS)
+        
+    async def _remember_state(self):
+        """Record the player page a successful play left us on"""
+        self._last_state = (await self._page_state())['fingerprint']
+        
+    async def _resume_if_playing(self) -> bool:
+        """Keep waiting on the movie from the previous loop if that same page is still playing it"""
+        if self._last_state is None:
+            return False
+        state = await self._page_state()
+        if state['fingerprint'] != self._last_state or not state['playing']:
+            self._last_state = None
+            return False
+        self.logger.info("Movie from the previous loop is still playing, skipping navigation")
+        await self.wait_for_movie_completion()
+        return True
+        
+    async def play_movie(self) -> bool:
         """Play the movie once"""
         try:
-            self.logger.info(f"Navigating to: {self.config.movie_url}")
-            self.page.goto(self.config.movie_url)
-            self.take_screenshot("page_loaded")
-            
-            # Wait for page to load
-            time.sleep(3)
-            
-            # Handle any modal overlays first
-            modal_dismissed = self.handle_modal_overlay()
-            if modal_dismissed:
-                self.logger.info("Modal overlay dismissed, waiting for page to stabilize...")
-                time.sleep(2)
+            if await self._resume_if_playing():
+                return True
+                
+            # The details page only needs its DOM to find the play button; skip images,
+            # fonts and media there and lift the block before the player loads
+            if self.config.block_resources:
+                await self.context.route("**/*", self._block_heavy_resources)
+            try:
+                self.logger.info("Navigating to: %s", self.config.movie_url)
+                # Only the DOM is needed; the wait below covers the content that matters
+                await self.page.goto(self.config.movie_url, wait_until='domcontentloaded')
+                self._reset_locators()
+                
+                # Wait for the details page to render a play button instead of for the
+                # network to go quiet (which analytics and prefetching can hold off)
+                try:
+                    await self._get_play_locator().wait_for(state='visible', timeout=self.config.element_wait_timeout * 1000)
+                except PlaywrightTimeoutError:
+                    self.logger.debug("No play button rendered yet, continuing")
+                await self.take_screenshot("page_loaded")
+                
+                # Handle any modal overlays first
+                modal_dismissed = await self.handle_modal_overlay()
+                if modal_dismissed:
+                    self.logger.info("Modal overlay dismissed, waiting for page to stabilize...")
+                    await self.wait_for_modal_hidden()
+            finally:
+                if self.config.block_resources:
+                    await self.context.unroute("**/*", self._block_heavy_resources)
             
             # Try to find and click play button
-            if not self.find_play_button():
+            # (this also waits for any navigation to the video player the click triggers)
+            if not await self.find_play_button(expect_nav=True):
                 self.logger.error("Failed to start movie playback")
                 return False
                 
-            self.take_screenshot("play_clicked")
+            await self.take_screenshot("play_clicked")
             
-            # Wait for potential navigation to video player
+            # Wait for the player to appear rather than a fixed pause
             try:
-                # Wait for navigation with a timeout
-                self.page.wait_for_url("**/watch/**", timeout=10000)
-                self.logger.info("Successfully navigated to video player page")
+                await self.page.wait_for_selector(PLAYER_SELECTOR, timeout=8000)
             except PlaywrightTimeoutError:
-                self.logger.info("No navigation detected, continuing with current page")
-            
-            # Wait a moment for playback to start
-            time.sleep(3)
+                self.logger.debug("No player element appeared within 8s")
             
             # Debug: Check current URL and page state
-            current_url = self.page.url
-            self.logger.info(f"Current URL after play click: {current_url}")
+            self.logger.info("Current URL after play click: %s", self.page.url)
             
             # Take another screenshot to see the state
-            self.take_screenshot("after_play_click")
+            await self.take_screenshot("after_play_click")
             
-            # Debug: Analyze page structure for video elements
-            self.analyze_page_structure()
+            # Debug: Analyze page structure for video elements (opt-in, it is not needed for playback)
+            if self.config.debug_analyze:
+                await self.analyze_page_structure()
             
-            if self.is_movie_playing():
+            if await self.is_movie_playing():
                 self.logger.info("Movie is now playing")
-                self.wait_for_movie_completion()
+                await self._remember_state()
+                await self.wait_for_movie_completion()
                 return True
             else:
                 self.logger.error("Movie did not start playing")
-                # Let's wait a bit longer and try again
-                time.sleep(5)
-                if self.is_movie_playing():
+                # Give the player page a little longer to load, then try again
+                try:
+                    await self.page.wait_for_url("**/watch/**", timeout=5000)
+                except PlaywrightTimeoutError:
+                    pass
+                if await self.is_movie_playing():
                     self.logger.info("Movie started playing after additional wait")
-                    self.wait_for_movie_completion()
+                    await self._remember_state()
+                    await self.wait_for_movie_completion()
                     return True
                 else:
                     self.logger.error("Movie still not playing after extended wait")
                     return False
                 
         except Exception as e:
-            self.logger.error(f"Error playing movie: {e}")
+            self.logger.error("Error playing movie: %s", e)
+            self._last_state = None
             return False
             
-    def run_automation(self):
+    async def run_automation(self):
         """Run the complete automation with looping"""
+        # Workers share their parent's stop event, so only the top-level agent handles signals
+        signals = self._install_signal_handlers() if self.worker_id is None else []
         try:
-            self.setup_browser()
+            await self.setup_browser()
             self.logger.info("Starting Roku movie automation")
             
             loop_count = 0
             
-            while True:
+            while loop_count < self.config.loop_limit and not self._stop_event.is_set():
                 loop_count += 1
-                self.logger.info(f"Starting loop {loop_count}")
+                loop_started = time.monotonic()
                 
-                success = self.play_movie()
+                # With reuse_page the same page just navigates again next loop. Otherwise,
+                # or after a failure, launched browsers get a fresh context; persistent
+                # contexts (which own their browser) are kept and only get a new page
+                if self.context is None:
+                    await self._new_session()
+                elif self.page is None or self.page.is_closed():
+                    self.page = await self.context.new_page()
+                    self.page.set_default_timeout(self.config.page_load_timeout * 1000)
+                    self._reset_locators()
+                success = False
+                try:
+                    success = await self._unless_stopped(self.play_movie())
+                finally:
+                    if self.browser is not None and not (self.config.reuse_page and success):
+                        await self._close_session()
+                if self._stop_event.is_set():
+                    self.logger.info(
+                        "loop=%d status=stopped duration=%.2fs next_wait=0s",
+                        loop_count, time.monotonic() - loop_started
+                    )
+                    self.logger.info("Stop requested, ending automation")
+                    break
                 
-                if success:
-                    self.logger.info(f"Loop {loop_count} completed successfully")
-                else:
-                    self.logger.error(f"Loop {loop_count} failed")
+                # One record per loop: outcome, how long it took and the wait before the next one
+                last_loop = loop_count >= self.config.loop_limit  # loop_limit is math.inf for infinite loops
+                self.logger.log(
+                    logging.INFO if success else logging.ERROR,
+                    "loop=%d status=%s duration=%.2fs next_wait=%ss",
+                    loop_count, "ok" if success else "fail", time.monotonic() - loop_started,
+                    0 if last_loop else self.config.loop_delay
+                )
                 
                 # Check if we should continue looping
-                if self.config.max_loops > 0 and loop_count >= self.config.max_loops:
-                    self.logger.info(f"Reached maximum loops ({self.config.max_loops})")
+                if last_loop:
+                    self.logger.info("Reached maximum loops (%d)", self.config.max_loops)
                     break
                     
                 # Wait before next loop
-                if self.config.max_loops == -1 or loop_count < self.config.max_loops:
-                    self.logger.info(f"Waiting {self.config.loop_delay} seconds before next loop...")
-                    time.sleep(self.config.loop_delay)
+                try:
+                    # Wakes immediately when request_stop() is called
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=self.config.loop_delay)
+                    self.logger.info("Stop requested, ending automation")
+                    break
+                except asyncio.TimeoutError:
+                    pass
                     
-        except KeyboardInterrupt:
-            self.logger.info("Automation interrupted by user")
         except Exception as e:
-            self.logger.error(f"Automation failed: {e}")
+            self.logger.error("Automation failed: %s", e)
         finally:
-            self.cleanup()
+            await self.cleanup()
+            self._remove_signal_handlers(signals)
             
-    def cleanup(self):
-        """Clean up resources"""
+    async def run_many(self, workers: int):
+        """Run the automation in several workers at once, each with its own context on the shared browser"""
+        self.logger.info("Starting %s parallel workers", workers)
+        agents = [RokuMovieAgent(self.config, worker_id=i, stop_event=self._stop_event) for i in range(1, workers + 1)]
+        signals = self._install_signal_handlers()
+        try:
+            await asyncio.gather(*(agent.run_automation() for agent in agents))
+        finally:
+            # Each worker already cleans up after itself; this covers workers that were cancelled
+            await asyncio.gather(*(agent.cleanup() for agent in agents), return_exceptions=True)
+            self._remove_signal_handlers(signals)
+        
+    async def cleanup(self):
+        """Clean up this agent's page and context and hand the browser back to the pool (safe to call twice)"""
+        page, context = self.page, self.context
+        self.page = self.context = None
+        self._last_state = None
+        self._reset_locators()
+        if page is None and context is None and self.browser is None:
+            return
+        
+        # Closing the context also closes its pages, so a page is only closed on its own
+        # when there is no context; failures are logged without skipping the release below
         try:
-            if self.page:
-                self.page.close()
-            if self.context:
-                self.context.close()
-            if self.browser:
-                self.browser.close()
-            if self.playwright:
-                self.playwright.stop()
-            self.logger.info("Browser resources cleaned up")
+            if context is not None:
+                await context.close()
+            elif page is not None:
+                await page.close()
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
+        if self.browser is not None:
+            self._pool.release(self.browser)
+            self.browser = None
+        self.logger.info("Browser resources cleaned up")